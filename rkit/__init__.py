@@ -0,0 +1,25 @@
+from rkit._lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from rkit.containers.sparsestorage import SparseStorage
+    from rkit.decorators.asyncindexableproperty import AsyncIndexableProperty
+    from rkit.decorators.indexableproperty import IndexableProperty
+    from rkit.patterns.observer import (
+        ParameterizedObserver, CompiledParameterizedObserver, ShardedParameterizedObserver
+    )
+    from rkit.patterns.singleton import Singleton
+
+# the components are imported on first access to keep the import of rkit cheap
+_EXPORTS = {
+    'SparseStorage': '.containers.sparsestorage',
+    'AsyncIndexableProperty': '.decorators.asyncindexableproperty',
+    'IndexableProperty': '.decorators.indexableproperty',
+    'ParameterizedObserver': '.patterns.observer',
+    'CompiledParameterizedObserver': '.patterns.observer',
+    'ShardedParameterizedObserver': '.patterns.observer',
+    'Singleton': '.patterns.singleton',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,33 @@
+import importlib
+from collections.abc import Callable
+
+# Used by the package __init__ modules instead of typing.TYPE_CHECKING since importing typing would more than triple
+# the import time of rkit. Type checkers treat any name TYPE_CHECKING as the one of typing.
+TYPE_CHECKING = False
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Creates the module __getattr__ and __dir__ functions (PEP 562) of a package that exposes the given attributes
+    without importing their modules until they are accessed for the first time.
+    E.g. __getattr__, __dir__ = lazy_exports(__name__, {'Singleton': '.patterns.singleton'}).
+
+    :param package: The name of the package, i.e. __name__ of the package __init__ module.
+    :param exports: The exported attribute names mapped to the, optionally relative, name of the module that
+    defines them.
+    :return: The __getattr__ and __dir__ functions for the package module.
+    """
+    module = importlib.import_module(package)
+
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # cache the value so that __getattr__ is not called again for this name
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
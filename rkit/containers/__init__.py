@@ -0,0 +1,12 @@
+from rkit._lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from rkit.containers.sparsestorage import SparseStorage
+
+_EXPORTS = {
+    'SparseStorage': '.sparsestorage',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
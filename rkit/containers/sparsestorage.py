@@ -0,0 +1,190 @@
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import TypeVar, Generic, overload
+
+V = TypeVar('V')
+
+
+class SparseStorage(Generic[V]):
+    """
+    A fixed size sequence of which most values are equal to a default value. Only the values differing from
+    the default value are stored in sorted key and value arrays, so the memory footprint is proportional to the
+    number of populated entries instead of the size.
+    Meant to be used as backing storage of an IndexableProperty, e.g.:
+
+    @IndexableProperty
+    def values(self, item):
+        return self._values[item]
+
+    @values.itemsetter
+    def values(self, key, value):
+        self._values[key] = value
+    """
+
+    def __init__(self, size: int, default: V = None):
+        """
+        Creates a new SparseStorage instance with all values being the default value.
+
+        :param size: The logical number of values.
+        :param default: The value of all not populated entries.
+        """
+        if size < 0:
+            raise ValueError(f'size has to be non-negative but is {size}')
+
+        self._size = size
+        self._default = default
+        self._keys: list[int] = []
+        self._values: list[V] = []
+
+    @property
+    def default(self) -> V:
+        """ The value of all not populated entries. """
+        return self._default
+
+    @property
+    def populated(self) -> int:
+        """ The number of entries that differ from the default value. """
+        return len(self._keys)
+
+    def items(self) -> Iterator[tuple[int, V]]:
+        """
+        Iterate over the populated entries in ascending key order.
+        :return: An iterator of (index, value) tuples.
+        """
+        return zip(list(self._keys), list(self._values))
+
+    def clear(self) -> None:
+        """
+        Reset all values to the default value.
+        """
+        self._keys.clear()
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[V]:
+        keys, values, default = self._keys, self._values, self._default
+        position = 0
+        for index in range(self._size):
+            if position < len(keys) and keys[position] == index:
+                yield values[position]
+                position += 1
+            else:
+                yield default
+
+    def __contains__(self, item) -> bool:
+        return item in self._values or (len(self._keys) < self._size and item == self._default)
+
+    @overload
+    def __getitem__(self, item: int) -> V: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[V]: ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            indices = range(*item.indices(self._size))
+            result = [self._default] * len(indices)
+            if indices.step > 0:
+                lower, upper = indices.start, indices.stop
+            else:
+                lower, upper = indices.stop + 1, indices.start + 1
+            for position in range(bisect_left(self._keys, lower), bisect_left(self._keys, upper)):
+                key = self._keys[position]
+                if (key - indices.start) % indices.step == 0:
+                    result[(key - indices.start) // indices.step] = self._values[position]
+            return result
+
+        index = self._index(item)
+        position = bisect_left(self._keys, index)
+        if position < len(self._keys) and self._keys[position] == index:
+            return self._values[position]
+        return self._default
+
+    def __setitem__(self, key: int | slice, value: V | Iterable[V]) -> None:
+        if isinstance(key, slice):
+            self._set_slice(key, value)
+            return
+
+        index = self._index(key)
+        position = bisect_left(self._keys, index)
+        is_populated = position < len(self._keys) and self._keys[position] == index
+        if value == self._default:
+            if is_populated:
+                del self._keys[position]
+                del self._values[position]
+        elif is_populated:
+            self._values[position] = value
+        else:
+            self._keys.insert(position, index)
+            self._values.insert(position, value)
+
+    def __delitem__(self, key: int | slice) -> None:
+        """
+        Resets the value(s) of the given key to the default value. The size is not changed.
+        """
+        if isinstance(key, slice):
+            self._reset_slice(key)
+        else:
+            self[key] = self._default
+
+    def __eq__(self, other):
+        if isinstance(other, SparseStorage):
+            return (self._size == other._size and self._default == other._default
+                    and self._keys == other._keys and self._values == other._values)
+        else:
+            return False
+
+    def __repr__(self) -> str:
+        entries = ', '.join(f'{key}: {value!r}' for key, value in self.items())
+        return f'{type(self).__name__}(size={self._size}, default={self._default!r}, {{{entries}}})'
+
+    def _index(self, key: int) -> int:
+        if not isinstance(key, int):
+            raise TypeError(f'{type(self).__name__} indices must be integers or slices, not {type(key).__name__}')
+        index = key + self._size if key < 0 else key
+        if not 0 <= index < self._size:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        return index
+
+    def _set_slice(self, key: slice, values: Iterable[V]) -> None:
+        indices = range(*key.indices(self._size))
+        values = list(values)
+        if len(values) != len(indices):
+            raise ValueError(
+                f'attempt to assign sequence of size {len(values)} to slice of size {len(indices)}'
+            )
+
+        if indices.step != 1:
+            for index, value in zip(indices, values):
+                self[index] = value
+            return
+
+        # replace all populated entries within the contiguous range in one splice
+        lower = bisect_left(self._keys, indices.start)
+        upper = bisect_left(self._keys, indices.stop)
+        populated = [(index, value) for index, value in zip(indices, values) if value != self._default]
+        self._keys[lower:upper] = [index for index, _ in populated]
+        self._values[lower:upper] = [value for _, value in populated]
+
+    def _reset_slice(self, key: slice) -> None:
+        # only the populated entries within the range are visited, so the cost is independent of the slice size
+        indices = range(*key.indices(self._size))
+        if not indices:
+            return
+        if indices.step > 0:
+            lower, upper = indices[0], indices[-1] + 1
+        else:
+            lower, upper = indices[-1], indices[0] + 1
+        lower = bisect_left(self._keys, lower)
+        upper = bisect_left(self._keys, upper)
+
+        if abs(indices.step) == 1:
+            del self._keys[lower:upper]
+            del self._values[lower:upper]
+            return
+
+        kept = [position for position in range(lower, upper) if (self._keys[position] - indices.start) % indices.step]
+        self._keys[lower:upper] = [self._keys[position] for position in kept]
+        self._values[lower:upper] = [self._values[position] for position in kept]
@@ -0,0 +1,14 @@
+from rkit._lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from rkit.decorators.asyncindexableproperty import AsyncIndexableProperty
+    from rkit.decorators.indexableproperty import IndexableProperty
+
+_EXPORTS = {
+    'AsyncIndexableProperty': '.asyncindexableproperty',
+    'IndexableProperty': '.indexableproperty',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,313 @@
+import asyncio
+import inspect
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Awaitable
+from typing import TypeVar, Generic, Any
+
+O = TypeVar('O')
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class _ReadaheadState:
+    """
+    Per instance bookkeeping of an AsyncIndexableProperty. Tracks the last accessed integer key to detect
+    sequential scans and holds the prefetched getter tasks in insertion order.
+    """
+
+    def __init__(self):
+        self.last_key: int | None = None
+        self.sequential: bool = False
+        self.buffer: OrderedDict[int, asyncio.Task] = OrderedDict()
+        self.pending_writes: int = 0
+
+    def discard(self, key: int) -> None:
+        task = self.buffer.pop(key, None)
+        if task is not None:
+            _discard_task(task)
+
+    def clear(self) -> None:
+        for task in self.buffer.values():
+            _discard_task(task)
+        self.buffer.clear()
+        self.last_key = None
+        self.sequential = False
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    if not task.done():
+        task.cancel()
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # prefetched keys may never be accessed, e.g. keys beyond the end, so their exceptions are marked as retrieved
+    # to not trigger 'exception was never retrieved' warnings. Awaiting the task still raises the exception.
+    if not task.cancelled():
+        task.exception()
+
+
+class AsyncIndexableProperty(Generic[O, T, R]):
+    """
+    An asynchronous counterpart of IndexableProperty. Items are accessed by awaiting the get, set and delete
+    functions of the property instead of using pythons __getitem__ and __setitem__ functions.
+    The accessor functions may either be coroutine functions or plain functions. Plain functions are executed
+    in a worker thread to not block the event loop.
+    If a readahead depth is configured, sequential access with integer keys is detected and the upcoming keys
+    are prefetched concurrently into a buffer bounded by the readahead depth.
+    """
+
+    def __init__(
+            self,
+            fget: Callable[[O, T], R | Awaitable[R]] = None,
+            fset: Callable[[O, T, R], None | Awaitable[None]] = None,
+            fdel: Callable[[O, T], None | Awaitable[None]] = None,
+            pdel: Callable[[O], None] = None,
+            doc: str = None,
+            readahead: int = 0
+    ):
+        """
+        Returns an asynchronous indexable property attribute.
+        Can be used as decorator directly or, to configure the readahead depth, as decorator factory
+        e.g. @AsyncIndexableProperty(readahead=8).
+
+        :param fget: is a function for accessing attribute value(s). It's parameters have to be as __getitem__
+        function.
+        :param fset: is a function for setting attribute value(s). It's parameters have to be as __setitem__
+        function.
+        :param fdel: is a function for deleting attribute value(s). It's parameters have to be as __delitem__
+        function.
+        :param pdel: is a function for deleting the attribute.
+        :param doc: creates a docstring for the attribute.
+        :param readahead: the maximum number of keys that are prefetched on sequential access. 0 disables
+        prefetching.
+        """
+        if readahead < 0:
+            raise ValueError(f'readahead has to be non-negative but is {readahead}')
+
+        self._fget: Callable[[O, T], R | Awaitable[R]] = fget
+        self._fset: Callable[[O, T, R], None | Awaitable[None]] = fset
+        self._fdel: Callable[[O, T], None | Awaitable[None]] = fdel
+        self._pdel: Callable[[O], None] = pdel
+        if doc is None and fget is not None:
+            doc = fget.__doc__
+        self._doc = doc
+        self._readahead = readahead
+        self._owner = None
+        self._name = ''
+
+        self._instance: O = None
+        # the readahead states are kept on the descriptor so that instances stay picklable and copyable
+        self._states: dict[int, tuple[weakref.ref, _ReadaheadState]] = {}
+
+    @property
+    def readahead(self) -> int:
+        """ The maximum number of keys that are prefetched on sequential access. """
+        return self._readahead
+
+    def __call__(self, fget: Callable[[O, T], R | Awaitable[R]]):
+        return self._copy(fget=fget)
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance: O, owner):
+        if instance is None:
+            return self
+        else:
+            self._instance = instance
+
+        if self._fget is None:
+            raise AttributeError(
+                f'AsyncIndexableProperty {self._name!r} of {type(instance).__name__!r} object has no getter'
+            )
+        return self
+
+    def __delete__(self, obj: O) -> None:
+        if self._pdel is None:
+            raise AttributeError(
+                f'AsyncIndexableProperty {self._name!r} of {type(obj).__name__!r} object has no deleter'
+            )
+        self._state(obj).clear()
+        self._pdel(obj)
+
+    def get(self, item: T) -> Awaitable[R]:
+        """
+        Asynchronously access the value(s) of the given key. Awaits a prefetched value if available.
+        The instance is bound when get is called, so the returned awaitable may be awaited later, e.g. in
+        asyncio.gather.
+        :param item: The key, e.g. an index or a slice.
+        :return: An awaitable of the value(s) returned by the item getter.
+        """
+        instance = self._instance
+        if self._fget is None:
+            message = (f'AsyncIndexableProperty {self._name!r} of {type(instance).__name__!r} object has no '
+                       f'item getter')
+            raise AttributeError(message)
+        return self._get(instance, item)
+
+    def set(self, key: T, value: R) -> Awaitable[None]:
+        """
+        Asynchronously set the value(s) of the given key. Invalidates all prefetched values.
+        The instance is bound when set is called.
+        :param key: The key, e.g. an index or a slice.
+        :param value: The value(s) to set.
+        :return: An awaitable that completes when the item setter has finished.
+        """
+        instance = self._instance
+        if self._fset is None:
+            raise AttributeError(
+                f'AsyncIndexableProperty {self._name!r} of {type(instance).__name__!r} object has no item setter'
+            )
+        return self._modify(self._fset, instance, key, value)
+
+    def delete(self, key: T) -> Awaitable[None]:
+        """
+        Asynchronously delete the value(s) of the given key. Invalidates all prefetched values.
+        The instance is bound when delete is called.
+        :param key: The key, e.g. an index or a slice.
+        :return: An awaitable that completes when the item deleter has finished.
+        """
+        instance = self._instance
+        if self._fdel is None:
+            raise AttributeError(
+                f'AsyncIndexableProperty {self._name!r} of {type(instance).__name__!r} object has no item deleter'
+            )
+        return self._modify(self._fdel, instance, key)
+
+    def itemgetter(self, fget: Callable[[Any, T], R | Awaitable[R]]):
+        """
+        Defines the get function for this asynchronous indexable property.
+        :param fget: A function that corresponds with the __getitem__ parameter list.
+        :return: The asynchronous indexable property.
+        """
+        return self._copy(fget=fget)
+
+    def itemsetter(self, fset: Callable[[Any, T, R], None | Awaitable[None]]):
+        """
+        Defines the set function for this asynchronous indexable property.
+        :param fset: A function that corresponds with the __setitem__ parameter list.
+        :return: The asynchronous indexable property.
+        """
+        return self._copy(fset=fset)
+
+    def itemdeleter(self, fdel: Callable[[Any, T], None | Awaitable[None]]):
+        """
+        Defines the delete function for this asynchronous indexable property.
+        :param fdel: A function that corresponds with the __delitem__ parameter list.
+        :return: The asynchronous indexable property.
+        """
+        return self._copy(fdel=fdel)
+
+    def deleter(self, pdel: Callable[[O], None]):
+        """
+        Defines the __del__ function for this asynchronous indexable property.
+        :param pdel: A function that corresponds with the __del__ parameter list.
+        :return: The asynchronous indexable property.
+        """
+        prop = self._copy(pdel=pdel)
+        prop._name = self._name
+        return prop
+
+    def _copy(self, **changes):
+        arguments = dict(
+            fget=self._fget, fset=self._fset, fdel=self._fdel, pdel=self._pdel, doc=self._doc,
+            readahead=self._readahead
+        )
+        arguments.update(changes)
+        return type(self)(**arguments)
+
+    async def _get(self, instance: O, item: T) -> R:
+        if self._readahead == 0:
+            return await self._call(self._fget, instance, item)
+
+        state = self._state(instance)
+        loop = asyncio.get_running_loop()
+        task = state.buffer.pop(item, None) if isinstance(item, int) else None
+        if task is not None and task.get_loop() is not loop:
+            _discard_task(task)
+            task = None
+
+        self._track(state, item)
+        self._prefetch(state, instance, loop)
+
+        if task is not None:
+            return await task
+        return await self._call(self._fget, instance, item)
+
+    async def _modify(self, function: Callable, instance: O, *args) -> None:
+        if self._readahead == 0:
+            await self._call(function, instance, *args)
+            return
+
+        # no keys are prefetched while a write is in progress and keys prefetched before are discarded on both ends
+        # of the write, as they may hold the values from before the write
+        state = self._state(instance)
+        state.clear()
+        state.pending_writes += 1
+        try:
+            await self._call(function, instance, *args)
+        finally:
+            state.pending_writes -= 1
+            state.clear()
+
+    def _state(self, instance: O) -> _ReadaheadState:
+        key = id(instance)
+        entry = self._states.get(key)
+        if entry is not None:
+            return entry[1]
+
+        states = self._states
+        try:
+            reference = weakref.ref(instance, lambda _: states.pop(key, None))
+        except TypeError:
+            raise TypeError(
+                f'AsyncIndexableProperty {self._name!r} with readahead requires {type(instance).__name__!r} '
+                f'objects to support weak references to track the readahead state'
+            ) from None
+        state = _ReadaheadState()
+        self._states[key] = (reference, state)
+        return state
+
+    @staticmethod
+    def _track(state: _ReadaheadState, item: T) -> None:
+        if isinstance(item, int):
+            state.sequential = state.last_key is not None and item == state.last_key + 1
+            state.last_key = item
+        elif isinstance(item, slice) and item.step in (None, 1) and isinstance(item.stop, int) and item.stop > 0:
+            # a forward slice read counts as sequential access up to its last key
+            state.sequential = True
+            state.last_key = item.stop - 1
+        else:
+            state.sequential = False
+            state.last_key = None
+
+        if not state.sequential:
+            # buffered keys are of no use anymore as the scan has been left
+            for task in state.buffer.values():
+                _discard_task(task)
+            state.buffer.clear()
+
+    def _prefetch(self, state: _ReadaheadState, instance: O, loop: asyncio.AbstractEventLoop) -> None:
+        if not state.sequential or state.pending_writes > 0:
+            return
+
+        # drop buffered keys the scan has already passed
+        for key in [key for key in state.buffer if key <= state.last_key]:
+            state.discard(key)
+
+        for key in range(state.last_key + 1, state.last_key + 1 + self._readahead):
+            if key not in state.buffer:
+                task = loop.create_task(self._call(self._fget, instance, key))
+                task.add_done_callback(_retrieve_exception)
+                state.buffer[key] = task
+
+    @staticmethod
+    async def _call(function: Callable, *args):
+        if inspect.iscoroutinefunction(function):
+            return await function(*args)
+        result = await asyncio.to_thread(function, *args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
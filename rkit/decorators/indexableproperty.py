@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import TypeVar, Generic, Any
 
 O = TypeVar('O')
@@ -6,6 +7,90 @@ T = TypeVar('T')
 R = TypeVar('R')
 
 
+class _WriteCombiner(Generic[O, R]):
+    """
+    Buffers element writes of an IndexableProperty and flushes them to the item setter. If merging is enabled,
+    adjacent indices are merged into contiguous slices to call the item setter as few times as possible.
+    """
+
+    def __init__(self, instance: O, fset: Callable[[O, Any, Any], None], threshold: int, merge: bool):
+        self._instance = instance
+        self._fset = fset
+        self._threshold = threshold
+        self._merge = merge
+        self._pending: dict[int, R] = {}
+
+    def __contains__(self, key) -> bool:
+        return self.is_combinable(key) and key in self._pending
+
+    def __getitem__(self, key: int) -> R:
+        return self._pending[key]
+
+    @staticmethod
+    def is_combinable(key) -> bool:
+        return isinstance(key, int) and key >= 0
+
+    @staticmethod
+    def combinable_indices(key, value) -> range | None:
+        """
+        Returns the indices a write of the given key and value affects if the write can be buffered, else None.
+        """
+        if not isinstance(key, slice) or not isinstance(key.start, int) or not isinstance(key.stop, int):
+            return None
+        step = 1 if key.step is None else key.step
+        if key.start < 0 or key.stop < 0 or not isinstance(step, int) or step <= 0:
+            return None
+        indices = range(key.start, key.stop, step)
+        try:
+            if len(value) != len(indices):
+                return None
+        except TypeError:
+            return None
+        return indices
+
+    def write(self, key, value) -> None:
+        if self.is_combinable(key):
+            self._pending[key] = value
+        else:
+            indices = self.combinable_indices(key, value) if self._merge else None
+            if indices is None:
+                self.flush()
+                self._fset(self._instance, key, value)
+                return
+            self._pending.update(zip(indices, value))
+
+        if len(self._pending) >= self._threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Passes all pending writes to the item setter. If merging is enabled, runs of adjacent indices are written
+        as one slice, else each index is written by its own call in the order of the first write to it.
+        A run is removed from the pending writes only after the item setter succeeded, so if the item setter
+        raises, the failed run and all following runs stay pending and the exception is propagated.
+        """
+        if not self._merge:
+            for key in list(self._pending):
+                self._fset(self._instance, key, self._pending[key])
+                del self._pending[key]
+            return
+
+        keys = sorted(self._pending)
+        start = 0
+        for end in range(1, len(keys) + 1):
+            if end < len(keys) and keys[end] == keys[end - 1] + 1:
+                continue
+            run = keys[start:end]
+            if len(run) == 1:
+                self._fset(self._instance, run[0], self._pending[run[0]])
+            else:
+                values = [self._pending[key] for key in run]
+                self._fset(self._instance, slice(run[0], run[-1] + 1), values)
+            for key in run:
+                del self._pending[key]
+            start = end
+
+
 class IndexableProperty(Generic[O, T, R]):
     """
     An instance property which can be accessed and modified by pythons __getitem__ and
@@ -50,6 +135,7 @@ class IndexableProperty(Generic[O, T, R]):
         self._name = ''
 
         self._instance: O = None
+        self._combiners: dict[int, _WriteCombiner[O, R]] = {}
 
     def __set_name__(self, owner, name):
         self._owner = owner
@@ -71,6 +157,14 @@ class IndexableProperty(Generic[O, T, R]):
         if self._fget is None:
             message = f'IndexableProperty {self._name!r} of {type(self._instance).__name__!r} object has no item getter'
             raise AttributeError(message)
+
+        combiner = self._combiners.get(id(self._instance)) if self._combiners else None
+        if combiner is not None:
+            if item in combiner:
+                return combiner[item]
+            if not combiner.is_combinable(item):
+                # the key may overlap buffered writes, e.g. slices or negative indices
+                combiner.flush()
         return self._fget(self._instance, item)
 
     def __setitem__(self, key: T, value: R) -> None:
@@ -78,13 +172,22 @@ class IndexableProperty(Generic[O, T, R]):
             raise AttributeError(
                 f'IndexableProperty {self._name!r} of {type(self._instance).__name__!r} object has no item setter'
             )
-        self._fset(self._instance, key, value)
+
+        combiner = self._combiners.get(id(self._instance)) if self._combiners else None
+        if combiner is not None:
+            combiner.write(key, value)
+        else:
+            self._fset(self._instance, key, value)
 
     def __delitem__(self, key: T) -> None:
         if self._fdel is None:
             raise AttributeError(
                 f'IndexableProperty {self._name!r} of {type(self._instance).__name__!r} object has no item deleter'
             )
+
+        combiner = self._combiners.get(id(self._instance)) if self._combiners else None
+        if combiner is not None:
+            combiner.flush()
         self._fdel(self._instance, key)
 
     def __delete__(self, obj: O) -> None:
@@ -94,6 +197,46 @@ class IndexableProperty(Generic[O, T, R]):
             )
         self._pdel(obj)
 
+    @contextmanager
+    def write_combining(self, threshold: int = 1024, merge: bool = False) -> Iterator[None]:
+        """
+        Buffers all item writes of the current instance with non-negative integer keys within the context and
+        flushes them on exit or when the number of pending writes reaches the threshold. Other writes flush the
+        buffer and are passed to the item setter directly. Reads within the context see the buffered writes.
+        Nested contexts share the buffer and settings of the outermost context.
+        By default each buffered index is flushed by its own item setter call. With merge enabled, slice writes
+        are buffered too and adjacent indices are merged into contiguous slices so that the item setter is called
+        as few times as possible. Only enable it if the item setter accepts forward slices with a list of values
+        of the same length and writing such a slice is equivalent to writing each index, e.g. not for dict backed
+        setters or list backed setters that rely on IndexError for indices out of range.
+        If the item setter raises during a flush, the failed and all following runs stay pending and the exception
+        is propagated. If the exception is caught within the context, the pending writes are flushed again later.
+        If the context is left by an exception, either from the body or from the final flush, all pending writes
+        are discarded. Writes that have already been flushed are not reverted.
+        E.g. with obj.my_property.write_combining(): ...
+        :param threshold: The number of pending writes that triggers a flush.
+        :param merge: Whether adjacent indices are written as slices.
+        """
+        if self._fset is None:
+            raise AttributeError(
+                f'IndexableProperty {self._name!r} of {type(self._instance).__name__!r} object has no item setter'
+            )
+        if threshold < 1:
+            raise ValueError(f'threshold has to be positive but is {threshold}')
+
+        instance = self._instance
+        if id(instance) in self._combiners:
+            yield
+            return
+
+        combiner = _WriteCombiner(instance, self._fset, threshold, merge)
+        self._combiners[id(instance)] = combiner
+        try:
+            yield
+            combiner.flush()
+        finally:
+            del self._combiners[id(instance)]
+
     def itemgetter(self, fget: Callable[[Any, T], R]):
         """
         Defines the __getitem__ function for this indexable property.
@@ -0,0 +1,18 @@
+from rkit._lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from rkit.patterns.observer import (
+        ParameterizedObserver, CompiledParameterizedObserver, ShardedParameterizedObserver
+    )
+    from rkit.patterns.singleton import Singleton
+
+_EXPORTS = {
+    'ParameterizedObserver': '.observer',
+    'CompiledParameterizedObserver': '.observer',
+    'ShardedParameterizedObserver': '.observer',
+    'Singleton': '.singleton',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,4 +1,8 @@
+import threading
 from collections.abc import Callable
+from functools import cache
+from itertools import chain
+from types import CodeType
 from typing import Generic, Any, TypeVarTuple
 
 
@@ -62,6 +66,184 @@ class ParameterizedObserver(Generic[*Ts]):
 
     def __eq__(self, other):
         if isinstance(other, ParameterizedObserver):
-            return self._listeners == other._listeners
+            return self.listeners == other.listeners
         else:
             return False
+
+
+_MAX_UNROLLED_LISTENERS = 128
+
+
+def _compile_dispatch(listeners: tuple[Callable, ...]) -> Callable[..., None]:
+    """
+    Creates a function that calls all given listeners with the passed arguments. Up to _MAX_UNROLLED_LISTENERS
+    listeners the function is generated with one call statement per listener, which avoids the loop overhead.
+    Larger listener sets are iterated in a loop over the tuple since the generated code would grow without bound.
+    """
+    if len(listeners) > _MAX_UNROLLED_LISTENERS:
+        def dispatch(*args):
+            for listener in listeners:
+                listener(*args)
+
+        return dispatch
+
+    namespace = {f'listener{index}': listener for index, listener in enumerate(listeners)}
+    exec(_dispatch_code(len(listeners)), namespace)
+    return namespace['dispatch']
+
+
+@cache
+def _dispatch_code(listener_count: int) -> CodeType:
+    """
+    Compiles the definition of an unrolled dispatch function for the given number of listeners. The listeners are
+    looked up as globals named listener0, listener1, ... of the namespace the code is executed in.
+    """
+    body = ''.join(f'    listener{index}(*args)\n' for index in range(listener_count)) or '    pass\n'
+    return compile(f'def dispatch(*args):\n{body}', f'<dispatch of {listener_count} listeners>', 'exec')
+
+
+class CompiledParameterizedObserver(ParameterizedObserver[*Ts]):
+    """
+    A ParameterizedObserver for listener sets that rarely change but are notified very often.
+    Whenever the listener set changes, a dispatch function that calls each listener in its own statement is
+    generated from a snapshot of the listeners. This makes notify_listeners cheaper at the cost of more expensive
+    listener registration. Above 128 listeners the dispatch function loops over the snapshot instead and only saves
+    the method call overhead.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._compile()
+
+    def add_listener(self, listener: Callable[[*Ts], Any]) -> bool:
+        is_added = super().add_listener(listener)
+        if is_added:
+            self._compile()
+        return is_added
+
+    def remove_listener(self, listener: Callable[[*Ts], Any]) -> bool:
+        is_removed = super().remove_listener(listener)
+        if is_removed:
+            self._compile()
+        return is_removed
+
+    def remove_all_listener(self) -> None:
+        super().remove_all_listener()
+        self._compile()
+
+    def notify_listeners(self, *args: *Ts) -> None:
+        """
+        Notify all registered listeners with the given parameter arguments.
+        Is replaced by the precompiled dispatch function on each instance.
+        :param args: The parameter arguments to pass to the listener functions.
+        """
+        self._compile()
+        self.notify_listeners(*args)
+
+    def __getstate__(self):
+        # the generated dispatch function can not be pickled and is recompiled on load
+        state = dict(vars(self))
+        del state['notify_listeners']
+        return state
+
+    def __setstate__(self, state):
+        vars(self).update(state)
+        self._compile()
+
+    def _compile(self) -> None:
+        # the instance attribute shadows the method to save the additional call on each notification
+        self.notify_listeners = _compile_dispatch(tuple(self._listeners))
+
+
+class ShardedParameterizedObserver(ParameterizedObserver[*Ts]):
+    """
+    A ParameterizedObserver for many threads registering, removing and notifying listeners concurrently, e.g. on
+    free-threaded python builds. The listeners are partitioned by their hash across shards that each have their
+    own lock, so concurrent registrations mostly do not contend. Each shard publishes an immutable snapshot of
+    its listeners on change which notify_listeners iterates and membership tests look up without acquiring any lock.
+    On builds with the GIL, threads do not run in parallel anyway and iterating all shards makes registering and
+    notifying several times slower than with ParameterizedObserver, so prefer ParameterizedObserver unless listeners
+    are modified while other threads notify.
+    """
+
+    def __init__(self, shard_count: int = 8):
+        """
+        Creates a new ShardedParameterizedObserver instance.
+
+        :param shard_count: The number of shards the listeners are partitioned across.
+        """
+        if shard_count < 1:
+            raise ValueError(f'shard_count has to be positive but is {shard_count}')
+
+        # the listener set of ParameterizedObserver is intentionally not initialized since the shards replace it
+        self._shards: tuple[set[Callable[[*Ts], object]], ...] = tuple(set() for _ in range(shard_count))
+        self._locks: tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(shard_count))
+        self._snapshots: list[frozenset[Callable[[*Ts], object]]] = [frozenset() for _ in range(shard_count)]
+
+    def add_listener(self, listener: Callable[[*Ts], Any]) -> bool:
+        """
+        Register a callable as listener.
+        :param listener: The callable function.
+        :returns True if the listener has been newly added. False if the listener is already registered.
+        """
+        index = hash(listener) % len(self._shards)
+        shard = self._shards[index]
+        with self._locks[index]:
+            if listener in shard:
+                return False
+            shard.add(listener)
+            self._snapshots[index] = frozenset(shard)
+            return True
+
+    def remove_listener(self, listener: Callable[[*Ts], Any]) -> bool:
+        """
+        Remove a callable from the registered listeners list.
+        :param listener: The callable function.
+        :return: True, if a registered listener actually has been removed from the list of listeners.
+        """
+        index = hash(listener) % len(self._shards)
+        shard = self._shards[index]
+        with self._locks[index]:
+            if listener not in shard:
+                return False
+            shard.remove(listener)
+            self._snapshots[index] = frozenset(shard)
+            return True
+
+    def remove_all_listener(self) -> None:
+        """
+        Remove all listeners.
+        """
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                shard.clear()
+                self._snapshots[index] = frozenset()
+
+    @property
+    def listeners(self) -> set[Callable[[*Ts], Any]]:
+        return set(chain.from_iterable(self._snapshots))
+
+    def notify_listeners(self, *args: *Ts) -> None:
+        """
+        Notify all registered listeners with the given parameter arguments.
+        Listeners registered or removed concurrently may or may not be notified.
+        :param args: The parameter arguments to pass to the listener functions.
+        """
+        for listener in chain.from_iterable(self._snapshots):
+            listener(*args)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._snapshots))
+
+    def __contains__(self, item):
+        return item in self._snapshots[hash(item) % len(self._shards)]
+
+    def __getstate__(self):
+        # locks can not be pickled and are recreated on load
+        state = dict(vars(self))
+        del state['_locks']
+        return state
+
+    def __setstate__(self, state):
+        vars(self).update(state)
+        self._locks = tuple(threading.Lock() for _ in range(len(self._shards)))
@@ -0,0 +1,72 @@
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+from pathlib import Path
+
+import rkitBenchmarks
+from rkitBenchmarks.benchmark import REGISTRY, measure, compare
+
+
+def discover() -> None:
+    """
+    Imports all benchmark modules so that their benchmarks are registered.
+    """
+    for module in pkgutil.walk_packages(rkitBenchmarks.__path__, f'{rkitBenchmarks.__name__}.'):
+        if module.name.endswith('_benchmark'):
+            importlib.import_module(module.name)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m rkitBenchmarks', description='Runs the rkit benchmark suite.')
+    parser.add_argument('--output', type=Path, help='The json file the results are written to.')
+    parser.add_argument('--baseline', type=Path, help='The json file of results to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='The relative slowdown, in addition to the timing spread, or memory growth that fails '
+                             'the comparison.')
+    parser.add_argument('--filter', default='', help='Only runs benchmarks whose key contains this string.')
+    arguments = parser.parse_args()
+
+    # fail before running the suite, which takes minutes
+    if arguments.baseline is not None and not arguments.baseline.exists():
+        print(f'Baseline {arguments.baseline} does not exist. Record it on the unchanged code with '
+              f'--output {arguments.baseline}, e.g. pixi run benchmark-baseline.', file=sys.stderr)
+        return 2
+
+    discover()
+    results = {}
+    for bench in REGISTRY:
+        if arguments.filter not in bench.key:
+            continue
+        results[bench.key] = measure(bench.setup(**bench.parameters))
+        result = results[bench.key]
+        print(f'{bench.key:<60} {result["ns_per_call"]:>12.1f} ns {result["relative_time"]:>8.2f} rel '
+              f'{result["spread"]:>6.1%} spread {result["peak_bytes"]:>8} B peak '
+              f'{result["allocated_blocks"]:>5} blocks {result["retained_bytes_per_call"]:>8.1f} B retained')
+
+    if arguments.output is not None:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        arguments.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    if arguments.baseline is not None:
+        baseline = json.loads(arguments.baseline.read_text())['results']
+        baseline = {key: result for key, result in baseline.items() if arguments.filter in key}
+        for key in results.keys() - baseline.keys():
+            print(f'NEW {key}: not in the baseline, not compared')
+        regressions = compare(results, baseline, arguments.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import gc
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A registered benchmark. The setup function is called with the parameters and returns the zero argument
+    callable that is measured.
+    """
+    name: str
+    parameters: dict[str, Any]
+    setup: Callable[..., Callable[[], Any]] = field(compare=False)
+
+    @property
+    def key(self) -> str:
+        """ The unique identifier of the benchmark including its parameters. """
+        if not self.parameters:
+            return self.name
+        parameters = ','.join(f'{name}={value}' for name, value in self.parameters.items())
+        return f'{self.name}[{parameters}]'
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(name: str, **parameters):
+    """
+    Registers the decorated setup function as benchmark with the given parameters. Can be stacked to register
+    the same setup function with multiple parameter sets.
+    :param name: The name of the benchmark.
+    :param parameters: The keyword arguments passed to the setup function.
+    :return: The decorator.
+    """
+    def decorator(setup: Callable[..., Callable[[], Any]]):
+        REGISTRY.append(Benchmark(name, parameters, setup))
+        return setup
+
+    return decorator
+
+
+def _identity(value):
+    return value
+
+
+def reference_workload() -> int:
+    """
+    A fixed pure python workload of function calls and loop iterations. Benchmark timings are reported relative
+    to it, which cancels out most of the speed differences between machines and runs.
+    """
+    total = 0
+    for i in range(50):
+        total += _identity(i)
+    return total
+
+
+def _calls_per_run(timer: timeit.Timer) -> int:
+    number, _ = timer.autorange()
+    # autorange targets runs of at least 0.2 seconds, shorter runs allow more repeats in the same time
+    return max(1, number // 20)
+
+
+def _relative_spread(values: list[float]) -> float:
+    quartiles = statistics.quantiles(values, n=4)
+    return (quartiles[2] - quartiles[0]) / statistics.median(values)
+
+
+def time_per_call(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """
+    Measures the time per call of the given function. Each timing run of the function is paired with a timing run
+    of the reference workload right before it, so that both are affected by the same machine state.
+    :param function: The zero argument function to measure.
+    :param repeat: The number of paired timing runs.
+    :return: The median time per call in nanoseconds, the median ratio of the time per call to the one of the
+    reference workload and the interquartile range of these ratios relative to their median.
+    """
+    reference_timer = timeit.Timer(reference_workload)
+    timer = timeit.Timer(function)
+    reference_number = _calls_per_run(reference_timer)
+    number = _calls_per_run(timer)
+
+    times = []
+    ratios = []
+    for _ in range(repeat):
+        reference_time = reference_timer.timeit(reference_number) / reference_number
+        time = timer.timeit(number) / number
+        times.append(time * 1e9)
+        ratios.append(time / reference_time)
+
+    return {
+        'ns_per_call': statistics.median(times),
+        'relative_time': statistics.median(ratios),
+        'spread': _relative_spread(ratios),
+    }
+
+
+def allocations(function: Callable[[], Any], calls: int = 100) -> dict[str, float]:
+    """
+    Measures the memory allocations of the given function with tracemalloc.
+    :param function: The zero argument function to measure.
+    :param calls: The number of calls used to determine the retained memory.
+    :return: The peak of memory allocated during one call in bytes, the number of memory blocks allocated by one
+    call that are alive afterward, including its return value, and the memory still allocated after a call in bytes.
+    """
+    # warm up caches so that only allocations of the measured code are traced
+    function()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    # the snapshots are allocated while tracing, so the retained memory is traced separately
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained_start, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            function()
+        gc.collect()
+        retained_end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    statistics_diff = after.filter_traces(exclude).compare_to(before.filter_traces(exclude), 'filename')
+    return {
+        'peak_bytes': peak - start,
+        'allocated_blocks': sum(max(stat.count_diff, 0) for stat in statistics_diff),
+        'retained_bytes_per_call': (retained_end - retained_start) / calls,
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int = 21) -> dict[str, float]:
+    """
+    Measures the time and memory allocations of the given function.
+    :param function: The zero argument function to measure.
+    :param repeat: The number of timing runs of which the median is reported.
+    :return: The measures of the time_per_call and allocations functions.
+    """
+    return {
+        **time_per_call(function, repeat),
+        **allocations(function),
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]],
+            threshold: float = 0.25, bytes_tolerance: int = 64, blocks_tolerance: int = 1) -> list[str]:
+    """
+    Compares benchmark results against a baseline. Timings are compared relative to the reference workload. A
+    slowdown is only reported if it exceeds the threshold plus the spread of the timing runs of both results.
+    :param results: The current results by benchmark key.
+    :param baseline: The baseline results by benchmark key.
+    :param threshold: The relative slowdown or memory growth that is reported as regression.
+    :param bytes_tolerance: The absolute memory growth in bytes that is never reported as regression.
+    :param blocks_tolerance: The absolute growth of allocated blocks that is never reported as regression.
+    :return: A description of each regression and of each baseline benchmark missing in the results.
+    """
+    regressions = []
+    for key, expected in baseline.items():
+        if key not in results:
+            regressions.append(f'{key}: missing in results, the benchmark has been removed or renamed')
+            continue
+        actual = results[key]
+        ratio = actual['relative_time'] / expected['relative_time']
+        if ratio > 1 + threshold + actual['spread'] + expected['spread']:
+            regressions.append(
+                f'{key}: {ratio:.2f}x slower relative to the reference workload '
+                f'({actual["ns_per_call"]:.1f} ns per call, baseline {expected["ns_per_call"]:.1f} ns)'
+            )
+        for metric, tolerance in [
+            ('peak_bytes', bytes_tolerance),
+            ('retained_bytes_per_call', bytes_tolerance),
+            ('allocated_blocks', blocks_tolerance),
+        ]:
+            limit = max(expected[metric] * (1 + threshold), expected[metric] + tolerance)
+            if actual[metric] > limit:
+                regressions.append(f'{key}: {metric} {actual[metric]:.0f}, baseline {expected[metric]:.0f}')
+    return regressions
@@ -0,0 +1,70 @@
+from rkit.decorators.indexableproperty import IndexableProperty
+from rkitBenchmarks.benchmark import benchmark
+
+
+class IndexablePropertyUser:
+    def __init__(self, size: int):
+        self._my_list = [i for i in range(size)]
+
+    @IndexableProperty
+    def my_property(self, item):
+        if isinstance(item, list):
+            return [self._my_list[i] for i in item]
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    def my_property(self, key, value):
+        if isinstance(key, list):
+            for i, v in zip(key, value):
+                self._my_list[i] = v
+        else:
+            self._my_list[key] = value
+
+
+@benchmark('indexableproperty.getitem', key='index')
+@benchmark('indexableproperty.getitem', key='slice')
+@benchmark('indexableproperty.getitem', key='fancy')
+def getitem(key: str):
+    user = IndexablePropertyUser(1000)
+    item = {'index': 500, 'slice': slice(100, 200), 'fancy': list(range(100, 200, 2))}[key]
+    return lambda: user.my_property[item]
+
+
+@benchmark('indexableproperty.setitem', key='index')
+@benchmark('indexableproperty.setitem', key='slice')
+@benchmark('indexableproperty.setitem', key='fancy')
+def setitem(key: str):
+    user = IndexablePropertyUser(1000)
+    item, value = {
+        'index': (500, -1),
+        'slice': (slice(100, 200), [-1] * 100),
+        'fancy': (list(range(100, 200, 2)), [-1] * 50),
+    }[key]
+
+    def run():
+        user.my_property[item] = value
+
+    return run
+
+
+@benchmark('indexableproperty.setitem_loop', write_combining='off')
+@benchmark('indexableproperty.setitem_loop', write_combining='single')
+@benchmark('indexableproperty.setitem_loop', write_combining='merge')
+def setitem_loop(write_combining: str):
+    user = IndexablePropertyUser(1000)
+
+    def run():
+        prop = user.my_property
+        for i in range(100, 200):
+            prop[i] = -1
+
+    if write_combining == 'off':
+        return run
+
+    merge = write_combining == 'merge'
+
+    def run_combined():
+        with user.my_property.write_combining(merge=merge):
+            run()
+
+    return run_combined
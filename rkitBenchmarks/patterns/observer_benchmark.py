@@ -0,0 +1,83 @@
+import statistics
+import timeit
+
+from rkit.patterns.observer import ParameterizedObserver, CompiledParameterizedObserver, ShardedParameterizedObserver
+from rkitBenchmarks.benchmark import benchmark
+
+OBSERVERS = {
+    'plain': ParameterizedObserver,
+    'compiled': CompiledParameterizedObserver,
+    'sharded': ShardedParameterizedObserver,
+}
+
+
+def _listener(a, b):
+    pass
+
+
+def _observer(observer_class: type[ParameterizedObserver], listener_count: int) -> ParameterizedObserver:
+    observer = observer_class()
+    for _ in range(listener_count):
+        observer.add_listener(lambda a, b: _listener(a, b))
+    return observer
+
+
+@benchmark('observer.notify', observer='plain', listeners=0)
+@benchmark('observer.notify', observer='sharded', listeners=0)
+@benchmark('observer.notify', observer='sharded', listeners=8)
+@benchmark('observer.notify', observer='plain', listeners=1)
+@benchmark('observer.notify', observer='plain', listeners=8)
+@benchmark('observer.notify', observer='plain', listeners=64)
+@benchmark('observer.notify', observer='compiled', listeners=0)
+@benchmark('observer.notify', observer='compiled', listeners=1)
+@benchmark('observer.notify', observer='compiled', listeners=8)
+@benchmark('observer.notify', observer='compiled', listeners=64)
+def notify(observer: str, listeners: int):
+    notify_listeners = _observer(OBSERVERS[observer], listeners).notify_listeners
+    return lambda: notify_listeners(1, 2)
+
+
+@benchmark('observer.add_remove_listener', observer='plain')
+@benchmark('observer.add_remove_listener', observer='sharded')
+@benchmark('observer.add_remove_listener', observer='compiled')
+def add_remove_listener(observer: str):
+    instance = _observer(OBSERVERS[observer], 8)
+    listener = lambda a, b: None
+
+    def run():
+        instance.add_listener(listener)
+        instance.remove_listener(listener)
+
+    return run
+
+
+def notify_speedup(listener_count: int, number: int, repeat: int = 21) -> tuple[float, float, float]:
+    """
+    Measures the time per notify_listeners call of a plain and a compiled observer with the given number of
+    listeners. The timing runs of both observers alternate so that each pair is affected by the same machine state.
+    :return: The median time per call of the plain and the compiled observer in nanoseconds and the median speedup
+    of the pairs.
+    """
+    plain_notify = _observer(ParameterizedObserver, listener_count).notify_listeners
+    compiled_notify = _observer(CompiledParameterizedObserver, listener_count).notify_listeners
+    plain_timer = timeit.Timer(lambda: plain_notify(1, 2))
+    compiled_timer = timeit.Timer(lambda: compiled_notify(1, 2))
+
+    plain_times = []
+    compiled_times = []
+    for _ in range(repeat):
+        plain_times.append(plain_timer.timeit(number) / number * 1e9)
+        compiled_times.append(compiled_timer.timeit(number) / number * 1e9)
+    speedups = [plain / compiled for plain, compiled in zip(plain_times, compiled_times)]
+    return statistics.median(plain_times), statistics.median(compiled_times), statistics.median(speedups)
+
+
+def main():
+    print(f'{"listeners":>9} {"loop [ns]":>10} {"compiled [ns]":>14} {"speedup":>8}')
+    for listener_count in [0, 1, 2, 3, 4, 8, 32, 64, 128, 256]:
+        loop, compiled, speedup = notify_speedup(listener_count, max(100, 10_000 // max(listener_count, 1)))
+        print(f'{listener_count:>9} {loop:>10.1f} {compiled:>14.1f} {speedup:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
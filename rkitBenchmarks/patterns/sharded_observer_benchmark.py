@@ -0,0 +1,57 @@
+import sys
+import threading
+import time
+
+from rkit.patterns.observer import ParameterizedObserver, ShardedParameterizedObserver
+
+
+def _listener(a):
+    pass
+
+
+def contention_throughput(
+        observer: ParameterizedObserver, thread_count: int, operations: int) -> tuple[float, int]:
+    """
+    Measures the throughput of threads concurrently adding, notifying and removing listeners on one observer.
+    Each thread runs the given number of add, notify, remove cycles with its own listener.
+    :return: The total number of cycles per second over all threads and the number of failed cycles, e.g. due to
+    a listener set that changed size during iteration.
+    """
+    barrier = threading.Barrier(thread_count + 1)
+    failures = [0] * thread_count
+
+    def work(thread_index: int):
+        listener = lambda a: _listener(a)
+        barrier.wait()
+        for i in range(operations):
+            try:
+                observer.add_listener(listener)
+                observer.notify_listeners(i)
+                observer.remove_listener(listener)
+            except RuntimeError:
+                failures[thread_index] += 1
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+    return thread_count * operations / duration, sum(failures)
+
+
+def main():
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {gil_enabled}')
+    print(f'{"threads":>7} {"plain [ops/s]":>14} {"failed":>7} {"sharded [ops/s]":>16} {"failed":>7} {"ratio":>6}')
+    for thread_count in [1, 2, 4, 8, 16]:
+        plain, plain_failures = contention_throughput(ParameterizedObserver(), thread_count, 20_000)
+        sharded, sharded_failures = contention_throughput(ShardedParameterizedObserver(), thread_count, 20_000)
+        print(f'{thread_count:>7} {plain:>14.0f} {plain_failures:>7} {sharded:>16.0f} {sharded_failures:>7} '
+              f'{sharded / plain:>5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+from rkit.patterns.singleton import Singleton
+from rkitBenchmarks.benchmark import benchmark
+
+
+def _singleton_class():
+    @Singleton
+    class SingletonImpl:
+        value = 10
+
+        def __init__(self, a=None, b=None):
+            self.a = a
+            self.b = b
+
+        @staticmethod
+        def static_member() -> int:
+            return 0
+
+    return SingletonImpl
+
+
+@benchmark('singleton.call', arguments=False)
+@benchmark('singleton.call', arguments=True)
+def call(arguments: bool):
+    singleton_class = _singleton_class()
+    if arguments:
+        singleton_class(1, b=2)
+        return lambda: singleton_class(1, b=2)
+    singleton_class()
+    return lambda: singleton_class()
+
+
+@benchmark('singleton.instance')
+def instance():
+    singleton_class = _singleton_class()
+    singleton_class()
+    return lambda: singleton_class.instance
+
+
+@benchmark('singleton.class_attribute')
+def class_attribute():
+    singleton_class = _singleton_class()
+    return lambda: singleton_class.static_member
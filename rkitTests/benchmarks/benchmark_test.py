@@ -0,0 +1,147 @@
+from unittest import TestCase
+
+from rkitBenchmarks.benchmark import allocations, compare
+
+
+def result(relative_time=1.0, spread=0.0, peak_bytes=1000, allocated_blocks=2, retained_bytes_per_call=0.0):
+    return {
+        'ns_per_call': relative_time * 100,
+        'relative_time': relative_time,
+        'spread': spread,
+        'peak_bytes': peak_bytes,
+        'allocated_blocks': allocated_blocks,
+        'retained_bytes_per_call': retained_bytes_per_call,
+    }
+
+
+class CompareTests(TestCase):
+    def test_compare__SameResults__ReturnsNoRegressions(self):
+        # Act
+        actual = compare({'bench': result()}, {'bench': result()})
+
+        # Assert
+        self.assertListEqual(actual, [])
+
+    def test_compare__SlowdownAboveThreshold__ReturnsRegression(self):
+        # Act
+        actual = compare({'bench': result(relative_time=1.3)}, {'bench': result()}, threshold=0.25)
+
+        # Assert
+        self.assertEqual(len(actual), 1)
+        self.assertRegex(actual[0], r'^bench: 1\.30x slower')
+
+    def test_compare__SlowdownWithinThresholdPlusSpread__ReturnsNoRegressions(self):
+        # Arrange
+        results = {'bench': result(relative_time=1.4, spread=0.1)}
+        baseline = {'bench': result(spread=0.1)}
+
+        # Act
+        actual = compare(results, baseline, threshold=0.25)
+
+        # Assert
+        self.assertListEqual(actual, [])
+
+    def test_compare__SlowdownAboveThresholdPlusSpread__ReturnsRegression(self):
+        # Arrange
+        results = {'bench': result(relative_time=1.5, spread=0.1)}
+        baseline = {'bench': result(spread=0.1)}
+
+        # Act
+        actual = compare(results, baseline, threshold=0.25)
+
+        # Assert
+        self.assertEqual(len(actual), 1)
+        self.assertRegex(actual[0], 'slower')
+
+    def test_compare__Speedup__ReturnsNoRegressions(self):
+        # Act
+        actual = compare({'bench': result(relative_time=0.5)}, {'bench': result()})
+
+        # Assert
+        self.assertListEqual(actual, [])
+
+    def test_compare__MemoryGrowthWithinAbsoluteTolerance__ReturnsNoRegressions(self):
+        # Arrange
+        results = {'bench': result(peak_bytes=64, allocated_blocks=1, retained_bytes_per_call=64)}
+        baseline = {'bench': result(peak_bytes=0, allocated_blocks=0, retained_bytes_per_call=0)}
+
+        # Act
+        actual = compare(results, baseline, bytes_tolerance=64, blocks_tolerance=1)
+
+        # Assert
+        self.assertListEqual(actual, [])
+
+    def test_compare__MemoryGrowthAboveAbsoluteTolerance__ReturnsRegressionPerMetric(self):
+        # Arrange
+        results = {'bench': result(peak_bytes=65, allocated_blocks=2, retained_bytes_per_call=65)}
+        baseline = {'bench': result(peak_bytes=0, allocated_blocks=0, retained_bytes_per_call=0)}
+
+        # Act
+        actual = compare(results, baseline, bytes_tolerance=64, blocks_tolerance=1)
+
+        # Assert
+        self.assertListEqual(actual, [
+            'bench: peak_bytes 65, baseline 0',
+            'bench: retained_bytes_per_call 65, baseline 0',
+            'bench: allocated_blocks 2, baseline 0',
+        ])
+
+    def test_compare__MemoryGrowthAboveRelativeThreshold__ReturnsRegression(self):
+        # Arrange
+        results = {'bench': result(peak_bytes=13000, allocated_blocks=120)}
+        baseline = {'bench': result(peak_bytes=10000, allocated_blocks=100)}
+
+        # Act
+        actual = compare(results, baseline, threshold=0.25)
+
+        # Assert
+        self.assertListEqual(actual, ['bench: peak_bytes 13000, baseline 10000'])
+
+    def test_compare__BaselineEntryMissingInResults__ReturnsMissingEntry(self):
+        # Arrange
+        results = {'bench': result()}
+        baseline = {'bench': result(), 'removed': result()}
+
+        # Act
+        actual = compare(results, baseline)
+
+        # Assert
+        self.assertEqual(len(actual), 1)
+        self.assertRegex(actual[0], '^removed: missing in results')
+
+    def test_compare__ResultMissingInBaseline__IsNotCompared(self):
+        # Act
+        actual = compare({'bench': result(), 'new': result(relative_time=10.0)}, {'bench': result()})
+
+        # Assert
+        self.assertListEqual(actual, [])
+
+
+class AllocationsTests(TestCase):
+    def test_allocations__NoAllocations__ReturnsNoBlocksAndNoRetainedBytes(self):
+        # Act
+        actual = allocations(lambda: None)
+
+        # Assert
+        self.assertEqual(actual['allocated_blocks'], 0)
+        self.assertEqual(actual['retained_bytes_per_call'], 0)
+
+    def test_allocations__ReturnsNewList__ReportsPeakAndBlocksButNoRetainedBytes(self):
+        # Act
+        actual = allocations(lambda: [0] * 1000)
+
+        # Assert
+        self.assertGreaterEqual(actual['peak_bytes'], 8000)
+        self.assertGreaterEqual(actual['allocated_blocks'], 1)
+        self.assertEqual(actual['retained_bytes_per_call'], 0)
+
+    def test_allocations__RetainsMemory__ReportsRetainedBytesPerCall(self):
+        # Arrange
+        retained = []
+
+        # Act
+        actual = allocations(lambda: retained.append(bytearray(1000)), calls=10)
+
+        # Assert
+        self.assertGreaterEqual(actual['retained_bytes_per_call'], 1000)
+        self.assertLess(actual['retained_bytes_per_call'], 2000)
@@ -0,0 +1,171 @@
+from unittest import TestCase
+
+from rkit.containers.sparsestorage import SparseStorage
+from rkit.decorators.indexableproperty import IndexableProperty
+
+
+class SparseStorageUser:
+    def __init__(self, size):
+        self._values = SparseStorage(size, default=0)
+
+    @IndexableProperty
+    def my_property(self, item):
+        return self._values[item]
+
+    @my_property.itemsetter
+    def my_property(self, key, value):
+        self._values[key] = value
+
+
+class SparseStorageTests(TestCase):
+    def test_construction__Always__HasNoPopulatedEntries(self):
+        # Arrange & Act
+        storage = SparseStorage(10 ** 12, default=0)
+
+        # Assert
+        self.assertEqual(len(storage), 10 ** 12)
+        self.assertEqual(storage.populated, 0)
+        self.assertEqual(storage[10 ** 11], 0)
+
+    def test_construction__NegativeSize__RaisesValueError(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            SparseStorage(-1)
+
+    def test_setitem__Index__PopulatesOnlyThatEntry(self):
+        # Arrange
+        storage = SparseStorage(10 ** 12, default=0)
+
+        # Act
+        storage[10 ** 11] = 5
+        storage[-1] = 7
+
+        # Assert
+        self.assertEqual(storage.populated, 2)
+        self.assertEqual(storage[10 ** 11], 5)
+        self.assertEqual(storage[10 ** 12 - 1], 7)
+
+    def test_setitem__DefaultValue__RemovesEntry(self):
+        # Arrange
+        storage = SparseStorage(100, default=0)
+        storage[5] = 1
+
+        # Act
+        storage[5] = 0
+
+        # Assert
+        self.assertEqual(storage.populated, 0)
+
+    def test_setitem__OutOfRange__RaisesIndexError(self):
+        # Arrange
+        storage = SparseStorage(100)
+
+        # Act & Assert
+        with self.assertRaises(IndexError):
+            storage[100] = 1
+        with self.assertRaises(IndexError):
+            _ = storage[-101]
+
+    def test_getitem__Sliced__ReturnsValuesWithDefaults(self):
+        # Arrange
+        storage = SparseStorage(100, default=0)
+        storage[3] = 3
+        storage[50] = 50
+
+        # Act
+        actual = storage[0:10]
+        actual_stepped = storage[60:0:-10]
+
+        # Assert
+        self.assertListEqual(actual, [0, 0, 0, 3, 0, 0, 0, 0, 0, 0])
+        self.assertListEqual(actual_stepped, [0, 50, 0, 0, 0, 0])
+
+    def test_setitem__Sliced__ReplacesRangeAndSkipsDefaults(self):
+        # Arrange
+        storage = SparseStorage(100, default=0)
+        storage[2] = 9
+        storage[20] = 20
+
+        # Act
+        storage[0:5] = [1, 0, 0, 0, 1]
+
+        # Assert
+        self.assertListEqual(list(storage.items()), [(0, 1), (4, 1), (20, 20)])
+
+    def test_setitem__SteppedSlice__SetsEveryStepValue(self):
+        # Arrange
+        storage = SparseStorage(10, default=0)
+
+        # Act
+        storage[::3] = [1, 2, 3, 4]
+
+        # Assert
+        self.assertListEqual(list(storage), [1, 0, 0, 2, 0, 0, 3, 0, 0, 4])
+
+    def test_setitem__SliceSizeMismatch__RaisesValueError(self):
+        # Arrange
+        storage = SparseStorage(10, default=0)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            storage[0:5] = [1, 2]
+
+    def test_delitem__Sliced__ResetsToDefault(self):
+        # Arrange
+        storage = SparseStorage(10, default=0)
+        storage[:] = [i for i in range(10)]
+
+        # Act
+        del storage[2:8]
+
+        # Assert
+        self.assertEqual(len(storage), 10)
+        self.assertListEqual(list(storage), [0, 1, 0, 0, 0, 0, 0, 0, 8, 9])
+
+    def test_delitem__HugeSlice__ResetsOnlyPopulatedEntries(self):
+        # Arrange
+        storage = SparseStorage(10 ** 12, default=0)
+        storage[5] = 5
+        storage[10 ** 11] = 1
+        storage[10 ** 12 - 1] = 2
+
+        # Act
+        del storage[1:10 ** 12 - 1]
+
+        # Assert
+        self.assertListEqual(list(storage.items()), [(10 ** 12 - 1, 2)])
+
+    def test_delitem__SteppedSlice__ResetsEveryStepValue(self):
+        # Arrange
+        storage = SparseStorage(10, default=0)
+        storage[:] = [i for i in range(10)]
+
+        # Act
+        del storage[1::3]
+        del storage[8:0:-4]
+
+        # Assert
+        self.assertListEqual(list(storage), [0, 0, 2, 3, 0, 5, 6, 0, 0, 9])
+
+    def test_items__Always__IteratesOnlyPopulatedEntriesInOrder(self):
+        # Arrange
+        storage = SparseStorage(10 ** 9, default=None)
+        for index in [10 ** 8, 7, 10 ** 6]:
+            storage[index] = str(index)
+
+        # Act
+        actual = list(storage.items())
+
+        # Assert
+        self.assertListEqual(actual, [(7, '7'), (10 ** 6, str(10 ** 6)), (10 ** 8, str(10 ** 8))])
+
+    def test_indexable_property__SparseBackend__GetsAndSetsValues(self):
+        # Arrange
+        user = SparseStorageUser(10 ** 12)
+
+        # Act
+        user.my_property[10 ** 10:10 ** 10 + 3] = [1, 2, 3]
+
+        # Assert
+        self.assertListEqual(user.my_property[10 ** 10 - 1:10 ** 10 + 4], [0, 1, 2, 3, 0])
+        self.assertEqual(user._values.populated, 3)
@@ -0,0 +1,345 @@
+import asyncio
+import copy
+import gc
+import pickle
+from unittest import IsolatedAsyncioTestCase
+
+from rkit.decorators.asyncindexableproperty import AsyncIndexableProperty
+
+
+class AsyncIndexablePropertyUser:
+    def __init__(self, array):
+        self._my_list = array
+        self.requested = []
+
+    @AsyncIndexableProperty
+    async def my_property(self, item):
+        self.requested.append(item)
+        await asyncio.sleep(0)
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    async def my_property(self, key, value):
+        self._my_list[key] = value
+
+
+class ReadaheadUser:
+    def __init__(self, array):
+        self._my_list = array
+        self.requested = []
+
+    @AsyncIndexableProperty(readahead=4)
+    async def my_property(self, item):
+        self.requested.append(item)
+        await asyncio.sleep(0)
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    async def my_property(self, key, value):
+        self._my_list[key] = value
+
+
+class SyncGetterUser:
+    def __init__(self, array):
+        self._my_list = array
+
+    @AsyncIndexableProperty(readahead=2)
+    def my_property(self, item):
+        return self._my_list[item]
+
+
+class SlowSetterReadaheadUser:
+    def __init__(self, array):
+        self._my_list = array
+        self.release_write = asyncio.Event()
+
+    @AsyncIndexableProperty(readahead=4)
+    async def my_property(self, item):
+        await asyncio.sleep(0)
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    async def my_property(self, key, value):
+        await self.release_write.wait()
+        self._my_list[key] = value
+
+
+class SlotsReadaheadUser:
+    __slots__ = ['_my_list']
+
+    def __init__(self, array):
+        self._my_list = array
+
+    @AsyncIndexableProperty(readahead=2)
+    async def my_property(self, item):
+        return self._my_list[item]
+
+
+class SlotsWeakrefReadaheadUser:
+    __slots__ = ['_my_list', '__weakref__']
+
+    def __init__(self, array):
+        self._my_list = array
+
+    @AsyncIndexableProperty(readahead=2)
+    async def my_property(self, item):
+        return self._my_list[item]
+
+
+class AsyncIndexablePropertyTests(IsolatedAsyncioTestCase):
+    def test_get_property__Always__ReturnsAsyncIndexablePropertyObject(self):
+        # Arrange
+        user = AsyncIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        actual = user.my_property
+
+        # Assert
+        self.assertIsInstance(actual, AsyncIndexableProperty)
+
+    def test_construction__NegativeReadahead__RaisesValueError(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            AsyncIndexableProperty(readahead=-1)
+
+    async def test_get__Index__ReturnsValue(self):
+        # Arrange
+        user = AsyncIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        actual = await user.my_property.get(42)
+
+        # Assert
+        self.assertEqual(actual, 42)
+
+    async def test_get__Sliced__ReturnsList(self):
+        # Arrange
+        user = AsyncIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        actual = await user.my_property.get(slice(10, 40))
+
+        # Assert
+        self.assertListEqual(actual, [i for i in range(10, 40)])
+
+    async def test_get__SyncGetter__ReturnsValue(self):
+        # Arrange
+        user = SyncGetterUser([i for i in range(100)])
+
+        # Act
+        actual = [await user.my_property.get(i) for i in range(10)]
+
+        # Assert
+        self.assertListEqual(actual, [i for i in range(10)])
+
+    async def test_set__Index__SetsValue(self):
+        # Arrange
+        user = AsyncIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        await user.my_property.set(5, -1)
+
+        # Assert
+        self.assertEqual(user._my_list[5], -1)
+
+    async def test_get__GatheredAcrossInstances__ReturnsValueOfEachInstance(self):
+        for user_class in [AsyncIndexablePropertyUser, ReadaheadUser]:
+            with self.subTest(user_class=user_class.__name__):
+                # Arrange
+                user_a = user_class([1, 2, 3])
+                user_b = user_class([10, 20, 30])
+
+                # Act
+                actual = await asyncio.gather(user_a.my_property.get(0), user_b.my_property.get(0))
+
+                # Assert
+                self.assertListEqual(actual, [1, 10])
+
+    async def test_get__AwaitedAfterOtherInstanceAccess__ReturnsValueOfBoundInstance(self):
+        # Arrange
+        user_a = AsyncIndexablePropertyUser([1, 2, 3])
+        user_b = AsyncIndexablePropertyUser([10, 20, 30])
+
+        # Act
+        coroutine_a = user_a.my_property.get(1)
+        coroutine_b = user_b.my_property.get(1)
+        actual_a, actual_b = await coroutine_a, await coroutine_b
+
+        # Assert
+        self.assertEqual(actual_a, 2)
+        self.assertEqual(actual_b, 20)
+
+    async def test_set__GatheredAcrossInstances__SetsValueOfEachInstance(self):
+        # Arrange
+        user_a = AsyncIndexablePropertyUser([1, 2, 3])
+        user_b = AsyncIndexablePropertyUser([10, 20, 30])
+
+        # Act
+        await asyncio.gather(user_a.my_property.set(0, -1), user_b.my_property.set(0, -10))
+
+        # Assert
+        self.assertListEqual(user_a._my_list, [-1, 2, 3])
+        self.assertListEqual(user_b._my_list, [-10, 20, 30])
+
+    async def test_get__NoReadahead__RequestsOnlyAccessedKeys(self):
+        # Arrange
+        user = AsyncIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        for i in range(5):
+            await user.my_property.get(i)
+
+        # Assert
+        self.assertListEqual(user.requested, [0, 1, 2, 3, 4])
+
+    async def test_get__SequentialAccess__PrefetchesUpcomingKeys(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+
+        # Act
+        await user.my_property.get(0)
+        await user.my_property.get(1)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        self.assertListEqual(sorted(user.requested), [0, 1, 2, 3, 4, 5])
+
+    async def test_get__SequentialScan__RequestsEachKeyOnce(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+
+        # Act
+        actual = [await user.my_property.get(i) for i in range(20)]
+        await asyncio.sleep(0.01)
+
+        # Assert
+        self.assertListEqual(actual, [i for i in range(20)])
+        self.assertListEqual(sorted(set(user.requested)), [i for i in range(24)])
+        self.assertEqual(len(user.requested), len(set(user.requested)))
+
+    async def test_get__SequentialScan__BufferIsBoundedByReadahead(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+
+        # Act
+        for i in range(10):
+            await user.my_property.get(i)
+        _, state = ReadaheadUser.my_property._states[id(user)]
+
+        # Assert
+        self.assertListEqual(list(state.buffer), [10, 11, 12, 13])
+
+    async def test_get__RandomAccess__DoesNotPrefetch(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+
+        # Act
+        for i in [50, 3, 70, 20]:
+            await user.my_property.get(i)
+
+        # Assert
+        self.assertListEqual(user.requested, [50, 3, 70, 20])
+
+    async def test_get__AfterSet__DoesNotReturnStalePrefetchedValue(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+        await user.my_property.get(0)
+        await user.my_property.get(1)
+        await asyncio.sleep(0.01)
+
+        # Act
+        await user.my_property.set(2, -1)
+        actual = await user.my_property.get(2)
+
+        # Assert
+        self.assertEqual(actual, -1)
+
+    async def test_get__ScanDuringSet__DoesNotReturnStalePrefetchedValue(self):
+        # Arrange
+        user = SlowSetterReadaheadUser([i for i in range(100)])
+        await user.my_property.get(0)
+
+        # Act
+        write = asyncio.create_task(user.my_property.set(4, 'NEW'))
+        await asyncio.sleep(0)
+        await user.my_property.get(1)
+        await user.my_property.get(2)
+        await asyncio.sleep(0.01)
+        user.release_write.set()
+        await write
+        await user.my_property.get(3)
+        actual = await user.my_property.get(4)
+
+        # Assert
+        self.assertEqual(actual, 'NEW')
+
+    async def test_get__PrefetchBeyondEnd__ReturnsValuesAndRaisesIndexErrorOnlyWhenAccessed(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(3)])
+
+        # Act
+        actual = [await user.my_property.get(i) for i in range(3)]
+
+        # Assert
+        self.assertListEqual(actual, [0, 1, 2])
+        with self.assertRaises(IndexError):
+            await user.my_property.get(3)
+
+    async def test_get__SlotsWithoutWeakrefAndReadahead__RaisesTypeError(self):
+        # Arrange
+        user = SlotsReadaheadUser([i for i in range(10)])
+
+        # Act & Assert
+        with self.assertRaisesRegex(TypeError, 'weak references'):
+            await user.my_property.get(0)
+
+    async def test_get__SlotsWithWeakrefAndReadahead__ReturnsValues(self):
+        # Arrange
+        user = SlotsWeakrefReadaheadUser([i for i in range(10)])
+
+        # Act
+        actual = [await user.my_property.get(i) for i in range(5)]
+
+        # Assert
+        self.assertListEqual(actual, [0, 1, 2, 3, 4])
+
+    async def test_get__RepeatedAccess__ReusesReadaheadState(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+        await user.my_property.get(0)
+        _, state = ReadaheadUser.my_property._states[id(user)]
+
+        # Act
+        await user.my_property.get(1)
+
+        # Assert
+        self.assertIs(ReadaheadUser.my_property._states[id(user)][1], state)
+
+    async def test_get__InstanceCollected__ReleasesReadaheadState(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+        await user.my_property.get(0)
+        key = id(user)
+        # the property is bound to the instance it was last accessed from
+        _ = ReadaheadUser([]).my_property
+
+        # Act
+        del user
+        gc.collect()
+
+        # Assert
+        self.assertNotIn(key, ReadaheadUser.my_property._states)
+
+    async def test_get__AfterSequentialScan__InstanceIsPicklableAndCopyable(self):
+        # Arrange
+        user = ReadaheadUser([i for i in range(100)])
+        for i in range(5):
+            await user.my_property.get(i)
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(user))
+        copied = copy.deepcopy(user)
+
+        # Assert
+        self.assertEqual(await unpickled.my_property.get(5), 5)
+        self.assertEqual(await copied.my_property.get(5), 5)
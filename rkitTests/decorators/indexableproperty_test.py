@@ -75,4 +75,290 @@ class IndexablePropertyTests(TestCase):
         user.my_property[10:40] = [1 for _ in range(10, 40)]
 
         # Assert
-        self.assertListEqual(user._my_list, [1 if 10 <= i < 40 else i for i in range(100)])
\ No newline at end of file
+        self.assertListEqual(user._my_list, [1 if 10 <= i < 40 else i for i in range(100)])
+
+
+class RecordingIndexablePropertyUser:
+    def __init__(self, array):
+        self._my_list = array
+        self.writes = []
+
+    @IndexableProperty
+    def my_property(self, item):
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    def my_property(self, key, value):
+        self.writes.append(key)
+        self._my_list[key] = value
+
+
+class FailingIndexablePropertyUser(RecordingIndexablePropertyUser):
+    def __init__(self, array, failing_key, failing_writes=1):
+        super().__init__(array)
+        self.failing_key = failing_key
+        self.failing_writes = failing_writes
+
+    @IndexableProperty
+    def my_property(self, item):
+        return self._my_list[item]
+
+    @my_property.itemsetter
+    def my_property(self, key, value):
+        self.writes.append(key)
+        if key == self.failing_key and self.failing_writes > 0:
+            self.failing_writes -= 1
+            raise IOError('write failed')
+        self._my_list[key] = value
+
+
+class DictIndexablePropertyUser:
+    def __init__(self):
+        self._my_dict = {}
+
+    @IndexableProperty
+    def my_property(self, item):
+        return self._my_dict[item]
+
+    @my_property.itemsetter
+    def my_property(self, key, value):
+        self._my_dict[key] = value
+
+
+class IndexablePropertyWriteCombiningTests(TestCase):
+    def test_write_combining__Indices__FlushesEachIndexInOrderOfFirstWrite(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining():
+            for i in [7, 3, 4, 7]:
+                user.my_property[i] = -i
+            writes_within_context = list(user.writes)
+
+        # Assert
+        self.assertListEqual(writes_within_context, [])
+        self.assertListEqual(user.writes, [7, 3, 4])
+        self.assertListEqual(user._my_list, [-i if i in [3, 4, 7] else i for i in range(100)])
+
+    def test_write_combining__SlicedWrite__FlushesAndWritesSliceDirectly(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(10)])
+
+        # Act
+        with user.my_property.write_combining():
+            user.my_property[5] = 1
+            user.my_property[0:2] = [1, 1]
+            writes_within_context = list(user.writes)
+
+        # Assert
+        self.assertListEqual(writes_within_context, [5, slice(0, 2)])
+        self.assertListEqual(user._my_list, [1 if i in [0, 1, 5] else i for i in range(10)])
+
+    def test_write_combining__IndexOutOfRange__RaisesIndexErrorOnExit(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(10)])
+
+        # Act
+        with self.assertRaises(IndexError):
+            with user.my_property.write_combining():
+                user.my_property[9] = -1
+                user.my_property[10] = -1
+
+        # Assert
+        self.assertListEqual(user._my_list, [-1 if i == 9 else i for i in range(10)])
+
+    def test_write_combining__DictBackedSetter__WritesEachKey(self):
+        # Arrange
+        user = DictIndexablePropertyUser()
+
+        # Act
+        with user.my_property.write_combining():
+            for i in range(5):
+                user.my_property[i] = -i
+
+        # Assert
+        self.assertDictEqual(user._my_dict, {i: -i for i in range(5)})
+
+    def test_write_combining__MergeAdjacentIndices__FlushesOneSliceOnExit(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining(merge=True):
+            for i in range(10, 20):
+                user.my_property[i] = -i
+            writes_within_context = list(user.writes)
+
+        # Assert
+        self.assertListEqual(writes_within_context, [])
+        self.assertListEqual(user.writes, [slice(10, 20)])
+        self.assertListEqual(user._my_list, [-i if 10 <= i < 20 else i for i in range(100)])
+
+    def test_write_combining__MergeSeparatedIndices__FlushesMinimalNumberOfCalls(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining(merge=True):
+            for i in [7, 3, 4, 5, 50, 8, 9]:
+                user.my_property[i] = -1
+
+        # Assert
+        self.assertListEqual(user.writes, [slice(3, 6), slice(7, 10), 50])
+        self.assertListEqual(user._my_list, [-1 if i in [3, 4, 5, 7, 8, 9, 50] else i for i in range(100)])
+
+    def test_write_combining__MergeSlicedWrite__IsMergedWithAdjacentIndices(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining(merge=True):
+            user.my_property[0:5] = [1, 1, 1, 1, 1]
+            user.my_property[5] = 1
+
+        # Assert
+        self.assertListEqual(user.writes, [slice(0, 6)])
+        self.assertListEqual(user._my_list, [1 if i < 6 else i for i in range(100)])
+
+    def test_write_combining__MergeThresholdReached__Flushes(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining(threshold=4, merge=True):
+            for i in range(10):
+                user.my_property[i] = -1
+
+        # Assert
+        self.assertListEqual(user.writes, [slice(0, 4), slice(4, 8), slice(8, 10)])
+
+    def test_write_combining__ReadBufferedIndex__ReturnsBufferedValue(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining():
+            user.my_property[3] = -1
+            actual = user.my_property[3]
+
+        # Assert
+        self.assertEqual(actual, -1)
+
+    def test_write_combining__ReadOverlappingSlice__SeesBufferedWrites(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining():
+            user.my_property[3] = -1
+            user.my_property[99] = -1
+            actual_slice = user.my_property[0:5]
+            actual_negative = user.my_property[-1]
+
+        # Assert
+        self.assertListEqual(actual_slice, [0, 1, 2, -1, 4])
+        self.assertEqual(actual_negative, -1)
+
+    def test_write_combining__NonCombinableKey__FlushesPendingWritesInOrder(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining():
+            user.my_property[99] = -1
+            user.my_property[-1] = -2
+
+        # Assert
+        self.assertListEqual(user.writes, [99, -1])
+        self.assertEqual(user._my_list[99], -2)
+
+    def test_write_combining__OtherInstance__IsNotBuffered(self):
+        # Arrange
+        user1 = RecordingIndexablePropertyUser([i for i in range(100)])
+        user2 = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user1.my_property.write_combining():
+            user2.my_property[0] = -1
+            user1.my_property[0] = -1
+            writes_within_context = list(user2.writes)
+
+        # Assert
+        self.assertListEqual(writes_within_context, [0])
+        self.assertListEqual(user1.writes, [0])
+
+    def test_write_combining__NestedContexts__FlushesOnOutermostExit(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(100)])
+
+        # Act
+        with user.my_property.write_combining(merge=True):
+            with user.my_property.write_combining():
+                user.my_property[0] = -1
+            writes_after_inner_context = list(user.writes)
+            user.my_property[1] = -1
+
+        # Assert
+        self.assertListEqual(writes_after_inner_context, [])
+        self.assertListEqual(user.writes, [slice(0, 2)])
+
+    def test_write_combining__SetterRaisesOnExit__PropagatesAndDiscardsPendingWrites(self):
+        # Arrange
+        user = FailingIndexablePropertyUser([i for i in range(10)], failing_key=1)
+
+        # Act
+        with self.assertRaises(IOError):
+            with user.my_property.write_combining():
+                user.my_property[1] = -1
+                user.my_property[5] = -5
+
+        # Assert
+        self.assertListEqual(user.writes, [1])
+        self.assertListEqual(user._my_list, [i for i in range(10)])
+
+    def test_write_combining__SetterErrorCaughtInContext__KeepsFailedAndFollowingRunsPending(self):
+        # Arrange
+        user = FailingIndexablePropertyUser([i for i in range(10)], failing_key=1)
+
+        # Act
+        with user.my_property.write_combining(threshold=2):
+            user.my_property[1] = -1
+            try:
+                user.my_property[5] = -5
+            except IOError:
+                pass
+            actual = user.my_property[5]
+
+        # Assert
+        self.assertEqual(actual, -5)
+        self.assertListEqual(user.writes, [1, 1, 5])
+        self.assertListEqual(user._my_list, [-1 if i == 1 else -5 if i == 5 else i for i in range(10)])
+
+    def test_write_combining__SetterRaisesForLaterRun__KeepsEarlierRunsWritten(self):
+        # Arrange
+        user = FailingIndexablePropertyUser([i for i in range(10)], failing_key=5)
+
+        # Act
+        with self.assertRaises(IOError):
+            with user.my_property.write_combining():
+                user.my_property[1] = -1
+                user.my_property[5] = -5
+
+        # Assert
+        self.assertListEqual(user.writes, [1, 5])
+        self.assertListEqual(user._my_list, [-1 if i == 1 else i for i in range(10)])
+
+    def test_write_combining__BodyRaises__DiscardsPendingWrites(self):
+        # Arrange
+        user = RecordingIndexablePropertyUser([i for i in range(10)])
+
+        # Act
+        with self.assertRaises(KeyError):
+            with user.my_property.write_combining():
+                user.my_property[1] = -1
+                raise KeyError()
+
+        # Assert
+        self.assertListEqual(user.writes, [])
+        self.assertListEqual(user._my_list, [i for i in range(10)])
@@ -0,0 +1,80 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+import rkit
+
+IMPORT_TIME_BUDGET_SECONDS = 0.05
+IMPORT_MODULE_BUDGET = 10
+
+MEASURE_IMPORT = '''
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import rkit
+duration = time.perf_counter() - start
+print(json.dumps({'duration': duration, 'modules': sorted(set(sys.modules) - before)}))
+'''
+
+IMPORT_ALL = '''
+import json, sys
+from rkit import *
+print(json.dumps(sorted(sys.modules)))
+'''
+
+
+def run_python(code: str):
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+class LazyExportsTests(TestCase):
+    def test_import__Always__StaysWithinModuleBudget(self):
+        # Act
+        actual = run_python(MEASURE_IMPORT)
+
+        # Assert
+        self.assertLessEqual(len(actual['modules']), IMPORT_MODULE_BUDGET, actual['modules'])
+        self.assertNotIn('rkit.patterns.observer', actual['modules'])
+        self.assertNotIn('typing', actual['modules'])
+
+    def test_import__Always__StaysWithinTimeBudget(self):
+        # Act
+        durations = [run_python(MEASURE_IMPORT)['duration'] for _ in range(3)]
+
+        # Assert
+        self.assertLessEqual(min(durations), IMPORT_TIME_BUDGET_SECONDS)
+
+    def test_import__AllExports__DoesNotImportNumpy(self):
+        # Act
+        actual = run_python(IMPORT_ALL)
+
+        # Assert
+        self.assertIn('rkit.patterns.observer', actual)
+        self.assertNotIn('numpy', actual)
+
+    def test_getattr__Export__ReturnsComponent(self):
+        # Arrange
+        from rkit.patterns.observer import ParameterizedObserver
+        from rkit.patterns.singleton import Singleton
+        from rkit.decorators.indexableproperty import IndexableProperty
+
+        # Act & Assert
+        self.assertIs(rkit.ParameterizedObserver, ParameterizedObserver)
+        self.assertIs(rkit.Singleton, Singleton)
+        self.assertIs(rkit.IndexableProperty, IndexableProperty)
+        self.assertIs(rkit.patterns.Singleton, Singleton)
+
+    def test_getattr__UnknownName__RaisesAttributeError(self):
+        # Act & Assert
+        with self.assertRaises(AttributeError):
+            _ = rkit.UnknownComponent
+
+    def test_dir__Always__ContainsAllExports(self):
+        # Act
+        actual = dir(rkit)
+
+        # Assert
+        for name in rkit.__all__:
+            self.assertIn(name, actual)
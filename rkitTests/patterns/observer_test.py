@@ -1,7 +1,15 @@
+import pickle
+import threading
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
-from rkit.patterns.observer import ParameterizedObserver
+from rkit.patterns.observer import ParameterizedObserver, CompiledParameterizedObserver, ShardedParameterizedObserver
+
+received_notifications = []
+
+
+def record_notification(value: int):
+    received_notifications.append(value)
 
 
 class ParameterizedObserverTests(TestCase):
@@ -290,3 +298,246 @@ class ParameterizedObserverTests(TestCase):
 
         # Assert
         self.assertFalse(equality)
+
+
+class CompiledParameterizedObserverTests(TestCase):
+    def test_notify_listeners__DifferentListenerCounts__CallsAllListenersWithParams(self):
+        for count in [0, 1, 2, 3, 4, 8, 128, 129]:
+            with self.subTest(count=count):
+                # Arrange
+                observer = CompiledParameterizedObserver[int, str]()
+                mocks = [MagicMock() for _ in range(count)]
+                for mock in mocks:
+                    observer.add_listener(mock)
+
+                # Act
+                observer.notify_listeners(5, 'test')
+
+                # Assert
+                for mock in mocks:
+                    mock.assert_called_once_with(5, 'test')
+
+    def test_notify_listeners__AfterRemoveListener__DoesNotCallRemovedListener(self):
+        # Arrange
+        observer = CompiledParameterizedObserver[int]()
+        mock_a, mock_b = MagicMock(), MagicMock()
+        observer.add_listener(mock_a)
+        observer.add_listener(mock_b)
+
+        # Act
+        observer.remove_listener(mock_a)
+        observer.notify_listeners(1)
+
+        # Assert
+        mock_a.assert_not_called()
+        mock_b.assert_called_once_with(1)
+
+    def test_notify_listeners__AfterRemoveAllListener__CallsNoListener(self):
+        # Arrange
+        observer = CompiledParameterizedObserver[int]()
+        mock = MagicMock()
+        observer.add_listener(mock)
+
+        # Act
+        observer.remove_all_listener()
+        observer.notify_listeners(1)
+
+        # Assert
+        mock.assert_not_called()
+        self.assertEqual(len(observer), 0)
+
+    def test_add_listener__AlreadyRegistered__ReturnsFalse(self):
+        # Arrange
+        observer = CompiledParameterizedObserver[int]()
+        mock = MagicMock()
+        observer.add_listener(mock)
+
+        # Act
+        actual = observer.add_listener(mock)
+        observer.notify_listeners(1)
+
+        # Assert
+        self.assertFalse(actual)
+        mock.assert_called_once_with(1)
+
+    def test_pickle__WithListeners__RestoresWorkingObserver(self):
+        # Arrange
+        observer = CompiledParameterizedObserver[int]()
+        observer.add_listener(record_notification)
+        received_notifications.clear()
+
+        # Act
+        actual = pickle.loads(pickle.dumps(observer))
+        actual.notify_listeners(5)
+
+        # Assert
+        self.assertEqual(actual, observer)
+        self.assertListEqual(received_notifications, [5])
+
+    def test_eq__SameListenersAsParameterizedObserver__ReturnsTrue(self):
+        # Arrange
+        mock = MagicMock()
+        observer1 = CompiledParameterizedObserver()
+        observer2 = ParameterizedObserver()
+        observer1.add_listener(mock)
+        observer2.add_listener(mock)
+
+        # Act
+        equality = observer1 == observer2
+
+        # Assert
+        self.assertTrue(equality)
+
+
+class ShardedParameterizedObserverTests(TestCase):
+    def test_construction__NonPositiveShardCount__RaisesValueError(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            ShardedParameterizedObserver(shard_count=0)
+
+    def test_add_listener__NotRegistered__ReturnsTrueAndContainsListener(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int]()
+        mock = MagicMock()
+
+        # Act
+        actual = observer.add_listener(mock)
+
+        # Assert
+        self.assertTrue(actual)
+        self.assertIn(mock, observer)
+        self.assertEqual(len(observer), 1)
+
+    def test_construction__Always__HasNoUnshardedListenerSet(self):
+        # Arrange & Act
+        observer = ShardedParameterizedObserver[int]()
+
+        # Assert
+        self.assertFalse(hasattr(observer, '_listeners'))
+
+    def test_add_listener__AlreadyRegistered__ReturnsFalse(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int]()
+        mock = MagicMock()
+        observer.add_listener(mock)
+
+        # Act
+        actual = observer.add_listener(mock)
+
+        # Assert
+        self.assertFalse(actual)
+        self.assertEqual(len(observer), 1)
+
+    def test_remove_listener__Registered__ReturnsTrueAndRemovesListener(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int]()
+        mock = MagicMock()
+        observer.add_listener(mock)
+
+        # Act
+        actual1 = observer.remove_listener(mock)
+        actual2 = observer.remove_listener(mock)
+
+        # Assert
+        self.assertTrue(actual1)
+        self.assertFalse(actual2)
+        self.assertNotIn(mock, observer)
+        self.assertEqual(len(observer), 0)
+
+    def test_notify_listeners__ManyListeners__CallsAllListenersWithParams(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int, str](shard_count=4)
+        mocks = [MagicMock() for _ in range(20)]
+        for mock in mocks:
+            observer.add_listener(mock)
+
+        # Act
+        observer.notify_listeners(5, 'test')
+
+        # Assert
+        for mock in mocks:
+            mock.assert_called_once_with(5, 'test')
+
+    def test_remove_all_listener__Always__EmptyListenerSet(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int]()
+        for _ in range(20):
+            observer.add_listener(MagicMock())
+
+        # Act
+        observer.remove_all_listener()
+
+        # Assert
+        self.assertEqual(len(observer), 0)
+        self.assertSetEqual(observer.listeners, set())
+
+    def test_eq__SameListenersAsParameterizedObserver__ReturnsTrue(self):
+        # Arrange
+        mocks = [MagicMock() for _ in range(5)]
+        observer1 = ShardedParameterizedObserver()
+        observer2 = ParameterizedObserver()
+        for mock in mocks:
+            observer1.add_listener(mock)
+            observer2.add_listener(mock)
+
+        # Act
+        equality1 = observer1 == observer2
+        equality2 = observer2 == observer1
+
+        # Assert
+        self.assertTrue(equality1)
+        self.assertTrue(equality2)
+
+    def test_add_listener__ConcurrentThreads__RegistersAllListeners(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int](shard_count=4)
+        listeners = [[lambda _: None for _ in range(200)] for _ in range(8)]
+
+        def register(thread_listeners):
+            for listener in thread_listeners:
+                observer.add_listener(listener)
+                observer.notify_listeners(0)
+
+        threads = [threading.Thread(target=register, args=(thread_listeners,)) for thread_listeners in listeners]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(len(observer), 8 * 200)
+        self.assertSetEqual(observer.listeners, {listener for ls in listeners for listener in ls})
+
+    def test_contains__ManyListeners__DoesNotCompareWithOtherListeners(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int](shard_count=1)
+        listeners = [MagicMock() for _ in range(100)]
+        for listener in listeners:
+            observer.add_listener(listener)
+        unregistered = MagicMock()
+
+        # Act
+        actual = unregistered in observer
+
+        # Assert
+        self.assertFalse(actual)
+        for listener in listeners:
+            listener.__eq__.assert_not_called()
+
+    def test_pickle__WithListeners__RestoresWorkingObserver(self):
+        # Arrange
+        observer = ShardedParameterizedObserver[int](shard_count=4)
+        observer.add_listener(record_notification)
+        received_notifications.clear()
+
+        # Act
+        actual = pickle.loads(pickle.dumps(observer))
+        actual.notify_listeners(5)
+        actual.remove_listener(record_notification)
+
+        # Assert
+        self.assertListEqual(received_notifications, [5])
+        self.assertEqual(len(actual), 0)
+        self.assertIn(record_notification, observer)